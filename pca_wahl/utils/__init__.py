@@ -2,10 +2,12 @@ from pca_wahl.utils.utils import color_dict
 from pca_wahl.utils.utils import load_election_data
 from pca_wahl.utils.utils import show_available_elections
 from pca_wahl.utils.utils import remove_party_from_data
+from pca_wahl.utils.utils import party_influence
 
 __all__ = [
     "color_dict",
     "load_election_data",
     "show_available_elections",
-    "remove_party_from_data"
+    "remove_party_from_data",
+    "party_influence"
 ]
\ No newline at end of file
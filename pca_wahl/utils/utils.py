@@ -31,6 +31,91 @@ def remove_party_from_data(data: SimpleNamespace, remove=[]) -> SimpleNamespace:
         data.X = np.delete(data.X, i, 0)
     return data
 
+def party_influence(data: SimpleNamespace, n_components=2) -> SimpleNamespace:
+    """
+    Function computes the influence of every party on the principal axes
+    by leaving out one party at a time (jackknife).
+
+    Only a single SVD of the centered data matrix is computed. Removing
+    party i changes the scatter matrix C^T C of the centered data C by the
+    rank-one downdate - n/(n-1) c_i c_i^T, where c_i is the centered row of
+    party i. Since c_i lies in the row space of C, every leave-one-out
+    decomposition follows from the eigendecomposition of a small
+    diag(s^2) - rho z z^T matrix with z = V^T c_i.
+
+    Parameters
+    ----------
+    data : SimpleNamespace
+        Namespace with data
+    n_components : int, optional, default: 2
+        Number of principal components to be analyzed, at most
+        min(N_parties-2, N_statements)
+
+    Returns
+    -------
+    influence : SimpleNamespace
+        Namespace with jackknife results:
+        parties : Party names
+        influence : Subspace influence of each party in [0, 1], i.e.
+            1 - ||V_k^T V'_k||_F^2 / k for the original and the jackknife
+            axes V_k and V'_k
+        angle : Angle in degrees between original and jackknife axes with
+            shape (N_parties, n_components)
+        explained_variance_ratio : Ratio of explained variance of the
+            jackknife axes with shape (N_parties, n_components)
+        components : Jackknife axes with signs aligned to the original axes
+            with shape (N_parties, n_components, N_statements)
+        components_full : Original axes with shape
+            (n_components, N_statements)
+        explained_variance_ratio_full : Ratio of explained variance of the
+            original axes
+    """
+    X = np.asarray(data.X, dtype=float)
+    N_par, N_the = X.shape
+    if N_par < 3:
+        raise ValueError("At least three parties are required.")
+    # Without one party the centered data has at most rank N_par-2
+    if not 1 <= n_components <= min(N_par-2, N_the):
+        raise ValueError(f"n_components must be between 1 and {min(N_par-2, N_the)}.")
+
+    C = X - X.mean(axis=0)
+    _, s, Vt = np.linalg.svd(C, full_matrices=False)
+    s2 = s**2
+
+    # Coordinates of the centered parties in the basis of the principal axes
+    Z = C @ Vt.T
+    rho = N_par / (N_par-1)
+
+    angle = np.empty((N_par, n_components))
+    explained_variance_ratio = np.empty((N_par, n_components))
+    influence = np.empty(N_par)
+    components = np.empty((N_par, n_components, N_the))
+    for i in range(N_par):
+        z = Z[i]
+        M = np.diag(s2) - rho * np.outer(z, z)
+        w, Q = np.linalg.eigh(M)
+        w = np.maximum(w[::-1], 0.)
+        Q = Q[:, ::-1][:, :n_components]
+        # Align signs of jackknife axes with original axes
+        sign = np.sign(np.diag(Q[:n_components]))
+        sign[sign == 0] = 1.
+        Q = Q * sign
+        overlap = Q[:n_components]
+        angle[i] = np.degrees(np.arccos(np.clip(np.diag(overlap), -1., 1.)))
+        explained_variance_ratio[i] = w[:n_components] / w.sum()
+        influence[i] = 1. - (overlap**2).sum() / n_components
+        components[i] = Q.T @ Vt
+
+    return SimpleNamespace(
+        parties=np.array(data.parties),
+        influence=influence,
+        angle=angle,
+        explained_variance_ratio=explained_variance_ratio,
+        components=components,
+        components_full=Vt[:n_components],
+        explained_variance_ratio_full=s2[:n_components] / s2.sum(),
+    )
+
 def show_available_elections():
     for election in elections:
         print(f"{election}: {elections[election]['name']:45s}", end="")